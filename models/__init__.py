@@ -7,13 +7,20 @@
     User - пользователь приложения
     Currency - валюта
     UserCurrency - связь пользователя с валютой (подписка)
+
+Модели импортируются лениво, при первом обращении к ним (PEP 562).
 """
 
-from models.author import Author
-from models.app import App
-from models.user import User
-from models.currency import Currency
-from models.user_currency import UserCurrency
+import importlib
+
+# Имя модели -> модуль, в котором она объявлена
+_LAZY = {
+    'Author': 'models.author',
+    'App': 'models.app',
+    'User': 'models.user',
+    'Currency': 'models.currency',
+    'UserCurrency': 'models.user_currency'
+}
 
 __all__ = [
     'Author',
@@ -21,4 +28,34 @@ __all__ = [
     'User',
     'Currency',
     'UserCurrency'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    """
+    Импортирует модель при первом обращении к ней.
+
+    Args:
+        name: Имя запрашиваемого атрибута пакета.
+
+    Returns:
+        Класс модели.
+
+    Raises:
+        AttributeError: Если в пакете нет модели с таким именем.
+    """
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    """
+    Возвращает список атрибутов пакета, включая ещё не загруженные модели.
+
+    Returns:
+        Список имён.
+    """
+    return sorted(set(globals()) | set(__all__))
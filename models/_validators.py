@@ -0,0 +1,50 @@
+"""
+Модуль содержит общие функции проверки полей моделей.
+"""
+
+
+def require_str(value: str, type_message: str, empty_message: str) -> str:
+    """
+    Проверяет, что значение является непустой строкой.
+
+    Args:
+        value: Проверяемое значение.
+        type_message: Текст ошибки при неверном типе.
+        empty_message: Текст ошибки при пустой строке.
+
+    Returns:
+        Строка без начальных и конечных пробелов.
+
+    Raises:
+        TypeError: Если value не является строкой.
+        ValueError: Если value пустая строка.
+    """
+    if type(value) is not str:
+        raise TypeError(type_message)
+    value = value.strip()
+    if not value:
+        raise ValueError(empty_message)
+    return value
+
+
+def require_positive_int(value: int, type_message: str, sign_message: str) -> int:
+    """
+    Проверяет, что значение является положительным целым числом.
+
+    Args:
+        value: Проверяемое значение.
+        type_message: Текст ошибки при неверном типе.
+        sign_message: Текст ошибки при неположительном значении.
+
+    Returns:
+        Исходное значение.
+
+    Raises:
+        TypeError: Если value не является целым числом.
+        ValueError: Если value отрицательный или нулевой.
+    """
+    if type(value) is not int:
+        raise TypeError(type_message)
+    if value <= 0:
+        raise ValueError(sign_message)
+    return value
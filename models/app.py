@@ -2,121 +2,54 @@
 Модуль содержит класс App.
 """
 
+from dataclasses import dataclass
+
+from models._validators import require_str
 from models.author import Author
 
 
+_APP_REPR_FMT = "App(name={!r}, version={!r}, author={!r})"
+
+
+@dataclass(slots=True, frozen=True, repr=False)
 class App:
     """
     Класс, представляющий приложение.
 
     Attributes:
-        _name (str): Название приложения.
-        _version (str): Версия приложения.
-        _author (Author): Автор приложения.
+        name (str): Название приложения.
+        version (str): Версия приложения.
+        author (Author): Автор приложения.
     """
 
-    def __init__(self, name: str, version: str, author: Author) -> None:
-        """
-        Инициализирует объект App.
+    name: str
+    version: str
+    author: Author
 
-        Args:
-            name: Название приложения.
-            version: Версия приложения.
-            author: Автор приложения.
+    def __post_init__(self) -> None:
+        """
+        Проверяет и нормализует поля объекта App.
 
         Raises:
             TypeError: Если аргументы имеют неверный тип.
             ValueError: Если аргументы недопустимы.
         """
-        self._name = None
-        self._version = None
-        self._author = None
-
-        # Используем сеттеры для инициализации с проверками
-        self.name = name
-        self.version = version
-        self.author = author
-
-    @property
-    def name(self) -> str:
-        """
-        Возвращает название приложения.
-
-        Returns:
-            Название приложения.
-        """
-        return self._name
-
-    @name.setter
-    def name(self, value: str) -> None:
-        """
-        Устанавливает название приложения.
-
-        Args:
-            value: Название приложения.
-
-        Raises:
-            TypeError: Если value не является строкой.
-            ValueError: Если value пустая строка.
-        """
-        if not isinstance(value, str):
-            raise TypeError("Название приложения должно быть строкой")
-        if not value.strip():
-            raise ValueError("Название приложения не может быть пустым")
-        self._name = value.strip()
-
-    @property
-    def version(self) -> str:
-        """
-        Возвращает версию приложения.
-
-        Returns:
-            Версия приложения.
-        """
-        return self._version
-
-    @version.setter
-    def version(self, value: str) -> None:
-        """
-        Устанавливает версию приложения.
-
-        Args:
-            value: Версия приложения.
-
-        Raises:
-            TypeError: Если value не является строкой.
-            ValueError: Если value пустая строка.
-        """
-        if not isinstance(value, str):
-            raise TypeError("Версия должна быть строкой")
-        if not value.strip():
-            raise ValueError("Версия не может быть пустой")
-        self._version = value.strip()
-
-    @property
-    def author(self) -> Author:
-        """
-        Возвращает автора приложения.
-
-        Returns:
-            Автор приложения.
-        """
-        return self._author
-
-    @author.setter
-    def author(self, value: Author) -> None:
-        """
-        Устанавливает автора приложения.
-
-        Args:
-            value: Автор приложения.
-
-        Raises:
-            TypeError: Если value не является объектом Author.
-        """
-        if not isinstance(value, Author):
+        name = require_str(
+            self.name,
+            "Название приложения должно быть строкой",
+            "Название приложения не может быть пустым"
+        )
+        object.__setattr__(self, 'name', name)
+
+        version = require_str(
+            self.version,
+            "Версия должна быть строкой",
+            "Версия не может быть пустой"
+        )
+        object.__setattr__(self, 'version', version)
+
+        if not isinstance(self.author, Author):
             raise TypeError("Автор должен быть объектом класса Author")
-        self._author = value
 
     def __str__(self) -> str:
         """
@@ -134,4 +67,4 @@ class App:
         Returns:
             Формальное строковое представление.
         """
-        return f"App(name='{self.name}', version='{self.version}', author={repr(self.author)})"
+        return _APP_REPR_FMT.format(self.name, self.version, self.author)
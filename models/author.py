@@ -2,90 +2,40 @@
 Модуль содержит класс Author для представления автора приложения.
 """
 
+from dataclasses import dataclass
 
+from models._validators import require_str
+
+
+_AUTHOR_REPR_FMT = "Author(name={!r}, group={!r})"
+
+
+@dataclass(slots=True, frozen=True, repr=False)
 class Author:
     """
     Класс, представляющий автора приложения.
 
     Attributes:
-        _name (str): Имя автора.
-        _group (str): Учебная группа автора.
+        name (str): Имя автора.
+        group (str): Учебная группа автора.
     """
 
-    def __init__(self, name: str, group: str) -> None:
-        """
-        Инициализирует объект Author.
+    name: str
+    group: str
 
-        Args:
-            name: Имя автора.
-            group: Учебная группа автора.
+    def __post_init__(self) -> None:
+        """
+        Проверяет и нормализует поля объекта Author.
 
         Raises:
             TypeError: Если name или group не являются строками.
             ValueError: Если name или group пустые.
         """
-        self._name = None
-        self._group = None
-
-        # Используем сеттеры для инициализации с проверками
-        self.name = name
-        self.group = group
-
-    @property
-    def name(self) -> str:
-        """
-        Возвращает имя автора.
-
-        Returns:
-            Имя автора.
-        """
-        return self._name
-
-    @name.setter
-    def name(self, value: str) -> None:
-        """
-        Устанавливает имя автора.
+        name = require_str(self.name, "Имя должно быть строкой", "Имя не может быть пустым")
+        object.__setattr__(self, 'name', name)
 
-        Args:
-            value: Имя автора.
-
-        Raises:
-            TypeError: Если value не является строкой.
-            ValueError: Если value пустая строка.
-        """
-        if not isinstance(value, str):
-            raise TypeError("Имя должно быть строкой")
-        if not value.strip():
-            raise ValueError("Имя не может быть пустым")
-        self._name = value.strip()
-
-    @property
-    def group(self) -> str:
-        """
-        Возвращает учебную группу автора.
-
-        Returns:
-            Учебная группа автора.
-        """
-        return self._group
-
-    @group.setter
-    def group(self, value: str) -> None:
-        """
-        Устанавливает учебную группу автора.
-
-        Args:
-            value: Учебная группа автора.
-
-        Raises:
-            TypeError: Если value не является строкой.
-            ValueError: Если value пустая строка.
-        """
-        if not isinstance(value, str):
-            raise TypeError("Группа должна быть строкой")
-        if not value.strip():
-            raise ValueError("Группа не может быть пустой")
-        self._group = value.strip()
+        group = require_str(self.group, "Группа должна быть строкой", "Группа не может быть пустой")
+        object.__setattr__(self, 'group', group)
 
     def __str__(self) -> str:
         """
@@ -103,4 +53,4 @@ class Author:
         Returns:
             Формальное строковое представление.
         """
-        return f"Author(name='{self.name}', group='{self.group}')"
\ No newline at end of file
+        return _AUTHOR_REPR_FMT.format(self.name, self.group)
@@ -2,31 +2,134 @@
 Модуль содержит класс Currency для представления валюты.
 """
 
-
+import dataclasses
+import functools
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from models._validators import require_str, require_positive_int
+
+
+# Символьные коды валют, публикуемых ЦБ РФ (плюс сам рубль)
+_KNOWN_CODES = frozenset({
+    'AED', 'AMD', 'AUD', 'AZN', 'BGN', 'BRL', 'BYN', 'CAD', 'CHF', 'CNY',
+    'CZK', 'DKK', 'EGP', 'EUR', 'GBP', 'GEL', 'HKD', 'HUF', 'IDR', 'INR',
+    'JPY', 'KGS', 'KRW', 'KZT', 'MDL', 'NOK', 'NZD', 'PLN', 'QAR', 'RON',
+    'RSD', 'RUB', 'SEK', 'SGD', 'THB', 'TJS', 'TMT', 'TRY', 'UAH', 'USD',
+    'UZS', 'VND', 'XDR', 'ZAR'
+})
+
+# Структура записи массива NumPy для пакетной обработки курсов (см. Currency.from_feed)
+_CURRENCY_DTYPE = [
+    ('id', 'i4'),
+    ('num_code', 'i4'),
+    ('char_code', 'U3'),
+    ('name', 'U64'),
+    ('value', 'f8'),
+    ('nominal', 'i4'),
+    ('rate_per_unit', 'f8')
+]
+
+_CURRENCY_REPR_FMT = "Currency(id={!r}, num_code={!r}, char_code={!r}, name={!r}, value={!r}, nominal={!r})"
+
+
+@dataclass(slots=True, frozen=True, repr=False)
 class Currency:
     """
     Класс, представляющий валюту.
 
+    Объекты сравниваются и хэшируются только по id.
+
     Attributes:
-        _id (int): Уникальный идентификатор валюты.
-        _num_code (int): Цифровой код валюты.
-        _char_code (str): Символьный код валюты.
-        _name (str): Название валюты.
-        _value (float): Курс валюты к рублю.
-        _nominal (int): Номинал (за сколько единиц указан курс).
+        id (int): Уникальный идентификатор валюты.
+        num_code (int): Цифровой код валюты.
+        char_code (str): Символьный код валюты.
+        name (str): Название валюты.
+        value (float): Курс валюты к рублю.
+        nominal (int): Номинал (за сколько единиц указан курс).
+        value_per_unit (float): Курс за одну единицу валюты (вычисляется).
     """
 
-    def __init__(
-            self,
+    id: int
+    num_code: int = field(compare=False)
+    char_code: str = field(compare=False)
+    name: str = field(compare=False)
+    value: float = field(compare=False)
+    nominal: int = field(compare=False)
+    value_per_unit: float = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """
+        Проверяет и нормализует поля объекта Currency.
+
+        Raises:
+            TypeError: Если аргументы имеют неверный тип.
+            ValueError: Если аргументы недопустимы.
+        """
+        require_positive_int(
+            self.id,
+            "ID должен быть целым числом",
+            "ID должен быть положительным числом"
+        )
+
+        require_positive_int(
+            self.num_code,
+            "Цифровой код должен быть целым числом",
+            "Цифровой код должен быть положительным числом"
+        )
+
+        char_code = require_str(
+            self.char_code,
+            "Символьный код должен быть строкой",
+            "Символьный код не может быть пустым"
+        )
+        # Коды из ленты ЦБ уже в каноническом виде: проверка длины и upper() не нужны
+        if char_code not in _KNOWN_CODES:
+            if len(char_code) != 3:
+                raise ValueError("Символьный код должен состоять из 3 символов")
+            char_code = char_code.upper()
+        object.__setattr__(self, 'char_code', char_code)
+
+        name = require_str(
+            self.name,
+            "Название должно быть строкой",
+            "Название не может быть пустым"
+        )
+        object.__setattr__(self, 'name', name)
+
+        value = self.value
+        value_type = type(value)
+        if value_type is not int and value_type is not float:
+            raise TypeError("Курс должен быть числом")
+        if value <= 0:
+            raise ValueError("Курс должен быть положительным числом")
+        if value_type is int:
+            value = float(value)
+            object.__setattr__(self, 'value', value)
+
+        nominal = require_positive_int(
+            self.nominal,
+            "Номинал должен быть целым числом",
+            "Номинал должен быть положительным числом"
+        )
+
+        object.__setattr__(self, 'value_per_unit', value / nominal)
+
+    @staticmethod
+    def create(
             currency_id: int,
             num_code: int,
             char_code: str,
             name: str,
             value: float,
             nominal: int
-    ) -> None:
+    ) -> "Currency":
         """
-        Инициализирует объект Currency.
+        Возвращает объект Currency, переиспользуя ранее созданные экземпляры.
+
+        Объекты неизменяемы, поэтому для одинаковых аргументов можно отдавать
+        один и тот же экземпляр и не повторять проверки полей. Аргументы
+        неверного типа в кэш не попадают: их проверяет конструктор.
 
         Args:
             currency_id: Уникальный идентификатор валюты.
@@ -36,194 +139,80 @@ class Currency:
             value: Курс валюты к рублю.
             nominal: Номинал валюты.
 
+        Returns:
+            Объект Currency.
+
         Raises:
             TypeError: Если аргументы имеют неверный тип.
             ValueError: Если аргументы недопустимы.
         """
-        self._id = None
-        self._num_code = None
-        self._char_code = None
-        self._name = None
-        self._value = None
-        self._nominal = None
-
-        # Используем сеттеры для инициализации с проверками
-        self.id = currency_id
-        self.num_code = num_code
-        self.char_code = char_code
-        self.name = name
-        self.value = value
-        self.nominal = nominal
+        # Ключ кэша хэшируется до проверок __post_init__, поэтому значения
+        # неверного типа (например, список) сразу передаются конструктору
+        value_type = type(value)
+        if (type(currency_id) is not int or type(num_code) is not int
+                or type(char_code) is not str or type(name) is not str
+                or (value_type is not float and value_type is not int)
+                or type(nominal) is not int):
+            return Currency(currency_id, num_code, char_code, name, value, nominal)
+        return _create_cached(currency_id, num_code, char_code, name, value, nominal)
 
-    @property
-    def id(self) -> int:
+    @classmethod
+    def from_feed(cls, records: Iterable["Currency"]):
         """
-        Возвращает идентификатор валюты.
+        Упаковывает список валют в структурированный массив NumPy.
 
-        Returns:
-            Идентификатор валюты.
-        """
-        return self._id
-
-    @id.setter
-    def id(self, value: int) -> None:
-        """
-        Устанавливает идентификатор валюты.
+        Массив хранит поля по столбцам, поэтому сортировка и фильтрация
+        по курсу выполняются векторно, без цикла по объектам Python.
+        Требует установленного пакета numpy.
 
         Args:
-            value: Идентификатор валюты.
-
-        Raises:
-            TypeError: Если value не является целым числом.
-            ValueError: Если value отрицательный или нулевой.
-        """
-        if not isinstance(value, int):
-            raise TypeError("ID должен быть целым числом")
-        if value <= 0:
-            raise ValueError("ID должен быть положительным числом")
-        self._id = value
-
-    @property
-    def num_code(self) -> int:
-        """
-        Возвращает цифровой код валюты.
+            records: Валюты для упаковки.
 
         Returns:
-            Цифровой код валюты.
+            Структурированный массив numpy.ndarray с полями id, num_code,
+            char_code, name, value, nominal и rate_per_unit.
         """
-        return self._num_code
+        import numpy as np
 
-    @num_code.setter
-    def num_code(self, value: int) -> None:
-        """
-        Устанавливает цифровой код валюты.
+        records = list(records)
+        arr = np.empty(len(records), dtype=_CURRENCY_DTYPE)
+        for i, r in enumerate(records):
+            arr[i] = (r.id, r.num_code, r.char_code, r.name, r.value, r.nominal, r.value_per_unit)
+        return arr
 
-        Args:
-            value: Цифровой код валюты.
-
-        Raises:
-            TypeError: Если value не является целым числом.
-            ValueError: Если value отрицательный или нулевой.
+    @staticmethod
+    def sort_by_rate(arr):
         """
-        if not isinstance(value, int):
-            raise TypeError("Цифровой код должен быть целым числом")
-        if value <= 0:
-            raise ValueError("Цифровой код должен быть положительным числом")
-        self._num_code = value
-
-    @property
-    def char_code(self) -> str:
-        """
-        Возвращает символьный код валюты.
-
-        Returns:
-            Символьный код валюты.
-        """
-        return self._char_code
-
-    @char_code.setter
-    def char_code(self, value: str) -> None:
-        """
-        Устанавливает символьный код валюты.
+        Сортирует массив, полученный из from_feed, по курсу за единицу.
 
         Args:
-            value: Символьный код валюты.
-
-        Raises:
-            TypeError: Если value не является строкой.
-            ValueError: Если value пустая или имеет неверную длину.
-        """
-        if not isinstance(value, str):
-            raise TypeError("Символьный код должен быть строкой")
-        if not value.strip():
-            raise ValueError("Символьный код не может быть пустым")
-        if len(value.strip()) != 3:
-            raise ValueError("Символьный код должен состоять из 3 символов")
-        self._char_code = value.strip().upper()
-
-    @property
-    def name(self) -> str:
-        """
-        Возвращает название валюты.
+            arr: Структурированный массив валют.
 
         Returns:
-            Название валюты.
+            Новый массив, упорядоченный по возрастанию rate_per_unit.
         """
-        return self._name
+        import numpy as np
 
-    @name.setter
-    def name(self, value: str) -> None:
-        """
-        Устанавливает название валюты.
-
-        Args:
-            value: Название валюты.
+        return np.sort(arr, order='rate_per_unit')
 
-        Raises:
-            TypeError: Если value не является строкой.
-            ValueError: Если value пустая строка.
-        """
-        if not isinstance(value, str):
-            raise TypeError("Название должно быть строкой")
-        if not value.strip():
-            raise ValueError("Название не может быть пустым")
-        self._name = value.strip()
-
-    @property
-    def value(self) -> float:
-        """
-        Возвращает курс валюты.
-
-        Returns:
-            Курс валюты к рублю.
+    def replace(self, **kwargs) -> "Currency":
         """
-        return self._value
+        Создаёт копию валюты с изменёнными полями.
 
-    @value.setter
-    def value(self, value: float) -> None:
-        """
-        Устанавливает курс валюты.
+        Все поля новой валюты проходят те же проверки, что и при создании.
 
         Args:
-            value: Курс валюты к рублю.
-
-        Raises:
-            TypeError: Если value не является числом.
-            ValueError: Если value отрицательный или нулевой.
-        """
-        if not isinstance(value, (int, float)):
-            raise TypeError("Курс должен быть числом")
-        if value <= 0:
-            raise ValueError("Курс должен быть положительным числом")
-        self._value = float(value)
-
-    @property
-    def nominal(self) -> int:
-        """
-        Возвращает номинал валюты.
+            **kwargs: Новые значения полей (id, num_code, char_code,
+                name, value, nominal).
 
         Returns:
-            Номинал валюты.
-        """
-        return self._nominal
-
-    @nominal.setter
-    def nominal(self, value: int) -> None:
-        """
-        Устанавливает номинал валюты.
-
-        Args:
-            value: Номинал валюты.
+            Новый объект Currency.
 
         Raises:
-            TypeError: Если value не является целым числом.
-            ValueError: Если value отрицательный или нулевой.
+            TypeError: Если передано неизвестное поле или значение неверного типа.
+            ValueError: Если значение недопустимо.
         """
-        if not isinstance(value, int):
-            raise TypeError("Номинал должен быть целым числом")
-        if value <= 0:
-            raise ValueError("Номинал должен быть положительным числом")
-        self._nominal = value
+        return dataclasses.replace(self, **kwargs)
 
     def get_value_per_unit(self) -> float:
         """
@@ -232,7 +221,7 @@ class Currency:
         Returns:
             Курс за одну единицу валюты.
         """
-        return self.value / self.nominal
+        return self.value_per_unit
 
     def __str__(self) -> str:
         """
@@ -250,6 +239,15 @@ class Currency:
         Returns:
             Формальное строковое представление.
         """
-        return (f"Currency(id={self.id}, num_code={self.num_code}, "
-                f"char_code='{self.char_code}', name='{self.name}', "
-                f"value={self.value}, nominal={self.nominal})")
\ No newline at end of file
+        return _CURRENCY_REPR_FMT.format(
+            self.id,
+            self.num_code,
+            self.char_code,
+            self.name,
+            self.value,
+            self.nominal
+        )
+
+
+# Кэш экземпляров для Currency.create (аргументы уже проверены на тип и хэшируемы)
+_create_cached = functools.lru_cache(maxsize=4096, typed=True)(Currency)
@@ -2,90 +2,45 @@
 Модуль содержит класс User для представления пользователя приложения.
 """
 
+from dataclasses import dataclass, field
 
+from models._validators import require_str, require_positive_int
+
+
+_USER_REPR_FMT = "User(id={!r}, name={!r})"
+
+
+@dataclass(slots=True, frozen=True, repr=False)
 class User:
     """
     Класс, представляющий пользователя приложения.
 
+    Объекты сравниваются и хэшируются только по id.
+
     Attributes:
-        _id (int): Уникальный идентификатор пользователя.
-        _name (str): Имя пользователя.
+        id (int): Уникальный идентификатор пользователя.
+        name (str): Имя пользователя.
     """
 
-    def __init__(self, user_id: int, name: str) -> None:
-        """
-        Инициализирует объект User.
+    id: int
+    name: str = field(compare=False)
 
-        Args:
-            user_id: Уникальный идентификатор пользователя.
-            name: Имя пользователя.
+    def __post_init__(self) -> None:
+        """
+        Проверяет и нормализует поля объекта User.
 
         Raises:
             TypeError: Если аргументы имеют неверный тип.
             ValueError: Если аргументы недопустимы.
         """
-        self._id = None
-        self._name = None
-
-        # Используем сеттеры для инициализации с проверками
-        self.id = user_id
-        self.name = name
-
-    @property
-    def id(self) -> int:
-        """
-        Возвращает идентификатор пользователя.
-
-        Returns:
-            Идентификатор пользователя.
-        """
-        return self._id
-
-    @id.setter
-    def id(self, value: int) -> None:
-        """
-        Устанавливает идентификатор пользователя.
-
-        Args:
-            value: Идентификатор пользователя.
-
-        Raises:
-            TypeError: Если value не является целым числом.
-            ValueError: Если value отрицательный или нулевой.
-        """
-        if not isinstance(value, int):
-            raise TypeError("ID должен быть целым числом")
-        if value <= 0:
-            raise ValueError("ID должен быть положительным числом")
-        self._id = value
-
-    @property
-    def name(self) -> str:
-        """
-        Возвращает имя пользователя.
-
-        Returns:
-            Имя пользователя.
-        """
-        return self._name
-
-    @name.setter
-    def name(self, value: str) -> None:
-        """
-        Устанавливает имя пользователя.
+        require_positive_int(
+            self.id,
+            "ID должен быть целым числом",
+            "ID должен быть положительным числом"
+        )
 
-        Args:
-            value: Имя пользователя.
-
-        Raises:
-            TypeError: Если value не является строкой.
-            ValueError: Если value пустая строка.
-        """
-        if not isinstance(value, str):
-            raise TypeError("Имя должно быть строкой")
-        if not value.strip():
-            raise ValueError("Имя не может быть пустым")
-        self._name = value.strip()
+        name = require_str(self.name, "Имя должно быть строкой", "Имя не может быть пустым")
+        object.__setattr__(self, 'name', name)
 
     def __str__(self) -> str:
         """
@@ -103,4 +58,4 @@ class User:
         Returns:
             Формальное строковое представление.
         """
-        return f"User(id={self.id}, name='{self.name}')"
\ No newline at end of file
+        return _USER_REPR_FMT.format(self.id, self.name)
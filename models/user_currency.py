@@ -2,122 +2,56 @@
 Модуль содержит класс UserCurrency для связи пользователей и валют.
 """
 
+from dataclasses import dataclass, field
 
+from models._validators import require_positive_int
+
+
+_USER_CURRENCY_REPR_FMT = "UserCurrency(id={!r}, user_id={!r}, currency_id={!r})"
+
+
+@dataclass(slots=True, frozen=True, repr=False)
 class UserCurrency:
     """
     Класс, представляющий связь пользователя с валютой (подписку).
 
+    Объекты сравниваются и хэшируются только по id.
+
     Attributes:
-        _id (int): Уникальный идентификатор связи.
-        _user_id (int): Идентификатор пользователя.
-        _currency_id (int): Идентификатор валюты.
+        id (int): Уникальный идентификатор связи.
+        user_id (int): Идентификатор пользователя.
+        currency_id (int): Идентификатор валюты.
     """
 
-    def __init__(self, link_id: int, user_id: int, currency_id: int) -> None:
-        """
-        Инициализирует объект UserCurrency.
+    id: int
+    user_id: int = field(compare=False)
+    currency_id: int = field(compare=False)
 
-        Args:
-            link_id: Уникальный идентификатор связи.
-            user_id: Идентификатор пользователя.
-            currency_id: Идентификатор валюты.
+    def __post_init__(self) -> None:
+        """
+        Проверяет поля объекта UserCurrency.
 
         Raises:
             TypeError: Если аргументы имеют неверный тип.
             ValueError: Если аргументы недопустимы.
         """
-        self._id = None
-        self._user_id = None
-        self._currency_id = None
-
-        # Используем сеттеры для инициализации с проверками
-        self.id = link_id
-        self.user_id = user_id
-        self.currency_id = currency_id
-
-    @property
-    def id(self) -> int:
-        """
-        Возвращает идентификатор связи.
+        require_positive_int(
+            self.id,
+            "ID должен быть целым числом",
+            "ID должен быть положительным числом"
+        )
 
-        Returns:
-            Идентификатор связи.
-        """
-        return self._id
-
-    @id.setter
-    def id(self, value: int) -> None:
-        """
-        Устанавливает идентификатор связи.
-
-        Args:
-            value: Идентификатор связи.
-
-        Raises:
-            TypeError: Если value не является целым числом.
-            ValueError: Если value отрицательный или нулевой.
-        """
-        if not isinstance(value, int):
-            raise TypeError("ID должен быть целым числом")
-        if value <= 0:
-            raise ValueError("ID должен быть положительным числом")
-        self._id = value
-
-    @property
-    def user_id(self) -> int:
-        """
-        Возвращает идентификатор пользователя.
+        require_positive_int(
+            self.user_id,
+            "ID пользователя должен быть целым числом",
+            "ID пользователя должен быть положительным числом"
+        )
 
-        Returns:
-            Идентификатор пользователя.
-        """
-        return self._user_id
-
-    @user_id.setter
-    def user_id(self, value: int) -> None:
-        """
-        Устанавливает идентификатор пользователя.
-
-        Args:
-            value: Идентификатор пользователя.
-
-        Raises:
-            TypeError: Если value не является целым числом.
-            ValueError: Если value отрицательный или нулевой.
-        """
-        if not isinstance(value, int):
-            raise TypeError("ID пользователя должен быть целым числом")
-        if value <= 0:
-            raise ValueError("ID пользователя должен быть положительным числом")
-        self._user_id = value
-
-    @property
-    def currency_id(self) -> int:
-        """
-        Возвращает идентификатор валюты.
-
-        Returns:
-            Идентификатор валюты.
-        """
-        return self._currency_id
-
-    @currency_id.setter
-    def currency_id(self, value: int) -> None:
-        """
-        Устанавливает идентификатор валюты.
-
-        Args:
-            value: Идентификатор валюты.
-
-        Raises:
-            TypeError: Если value не является целым числом.
-            ValueError: Если value отрицательный или нулевой.
-        """
-        if not isinstance(value, int):
-            raise TypeError("ID валюты должен быть целым числом")
-        if value <= 0:
-            raise ValueError("ID валюты должен быть положительным числом")
-        self._currency_id = value
+        require_positive_int(
+            self.currency_id,
+            "ID валюты должен быть целым числом",
+            "ID валюты должен быть положительным числом"
+        )
 
     def __str__(self) -> str:
         """
@@ -135,4 +69,4 @@ class UserCurrency:
         Returns:
             Формальное строковое представление.
         """
-        return f"UserCurrency(id={self.id}, user_id={self.user_id}, currency_id={self.currency_id})"
\ No newline at end of file
+        return _USER_CURRENCY_REPR_FMT.format(self.id, self.user_id, self.currency_id)
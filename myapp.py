@@ -3,19 +3,243 @@
 Реализует HTTP сервер с маршрутизацией и MVC архитектурой.
 """
 
+import email.utils
+import functools
 import http.server
-import socketserver
 import urllib.parse
 import json
 import os
-from datetime import datetime
+import threading
+import time
+from collections import Counter, defaultdict
 from typing import Dict, List, Optional, Tuple
 from jinja2 import Environment, PackageLoader, select_autoescape
 
 # Импорт моделей
 from models import Author, App, User, Currency, UserCurrency
 # Импорт функции для получения курсов валют
-from utils.currencies_api import get_currencies
+from utils.currencies_api import UPDATE_TIME_FORMAT, get_cached_currencies
+
+# Инициализация Jinja2 Environment (один раз при старте).
+# Шаблоны не меняются во время работы сервера, поэтому отключаем
+# проверку их актуальности и ограничение размера кэша.
+env = Environment(
+    loader=PackageLoader("myapp"),
+    autoescape=select_autoescape(),
+    auto_reload=False,
+    cache_size=-1
+)
+
+# Скомпилированные шаблоны страниц: имя -> Template
+_TEMPLATES = {
+    name: env.get_template(name)
+    for name in (
+        "index.html",
+        "users.html",
+        "user_detail.html",
+        "currencies.html",
+        "author.html"
+    )
+}
+
+# MIME-типы статических файлов по расширению
+_MIME_TYPES = {
+    '.css': 'text/css',
+    '.js': 'application/javascript',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.ico': 'image/x-icon',
+    '.svg': 'image/svg+xml'
+}
+
+# Кэш небольших статических файлов:
+# нормализованный путь -> (готовые заголовки, содержимое, mtime файла,
+# время последней проверки).
+# Файлы крупнее _STATIC_CACHE_MAX_SIZE отдаются через sendfile без кэширования,
+# суммарный размер содержимого в кэше не превышает _STATIC_CACHE_MAX_TOTAL.
+_STATIC_CACHE: Dict[str, Tuple[bytes, bytes, float, float]] = {}
+_STATIC_CACHE_MAX_SIZE = 256 * 1024
+_STATIC_CACHE_MAX_TOTAL = 8 * 1024 * 1024
+_static_cache_total = 0
+_static_cache_lock = threading.Lock()
+# Как часто (в секундах) проверять, не изменился ли закэшированный файл
+_STATIC_CACHE_CHECK_INTERVAL = 10
+
+# Готовая страница /currencies: (курсы из API, время их получения) -> HTML
+_CURRENCIES_PAGE_CACHE: Dict[Tuple, bytes] = {}
+
+
+@functools.lru_cache(maxsize=128)
+def _error_body(code: int, message: str) -> bytes:
+    """
+    Формирует HTML страницы с ошибкой.
+
+    Набор кодов и сообщений невелик, поэтому готовые страницы кэшируются.
+
+    Args:
+        code: HTTP код ошибки
+        message: Сообщение об ошибке
+
+    Returns:
+        HTML страницы в виде bytes
+    """
+    error_html = f"""
+        <html>
+        <head><title>Ошибка {code}</title></head>
+        <body>
+            <h1>Ошибка {code}</h1>
+            <p>{message}</p>
+            <p><a href="/">Вернуться на главную</a></p>
+        </body>
+        </html>
+        """
+    return error_html.encode('utf-8')
+
+
+# Значение заголовка Date для текущей секунды: (секунда, строка)
+_DATE_HEADER: Tuple[int, str] = (0, "")
+
+
+def _http_date() -> str:
+    """
+    Возвращает текущее время в формате заголовка Date.
+
+    Строка форматируется не чаще раза в секунду и переиспользуется
+    всеми ответами в пределах этой секунды.
+
+    Returns:
+        Дата в формате RFC 7231
+    """
+    global _DATE_HEADER
+    now = int(time.time())
+    if _DATE_HEADER[0] != now:
+        _DATE_HEADER = (now, email.utils.formatdate(now, usegmt=True))
+    return _DATE_HEADER[1]
+
+
+def _content_headers(content_type: str, length: int) -> bytes:
+    """
+    Формирует заголовки Content-Type и Content-Length с завершающей пустой строкой.
+
+    Args:
+        content_type: MIME-тип контента
+        length: Длина тела ответа в байтах
+
+    Returns:
+        Заголовки в виде bytes
+    """
+    return (
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {length}\r\n\r\n"
+    ).encode('latin-1')
+
+
+def _get_static_cache_entry(full_path: str) -> Optional[Tuple[bytes, bytes, float, float]]:
+    """
+    Возвращает закэшированный статический файл, если он не устарел.
+
+    Изменение файла проверяется по mtime не чаще, чем раз в
+    _STATIC_CACHE_CHECK_INTERVAL секунд; устаревшая запись удаляется.
+    Запись обновляется и удаляется, только если за время проверки её
+    не заменил другой поток.
+
+    Args:
+        full_path: Путь к файлу
+
+    Returns:
+        Запись кэша или None, если файла нет в кэше или он изменился
+    """
+    entry = _STATIC_CACHE.get(full_path)
+    if entry is None:
+        return None
+
+    now = time.monotonic()
+    if now - entry[3] < _STATIC_CACHE_CHECK_INTERVAL:
+        return entry
+
+    try:
+        mtime = os.stat(full_path).st_mtime
+    except OSError:
+        mtime = None
+    if mtime != entry[2]:
+        _drop_static_cache_entry(full_path, entry)
+        return None
+
+    refreshed = (entry[0], entry[1], entry[2], now)
+    with _static_cache_lock:
+        if _STATIC_CACHE.get(full_path) is entry:
+            _STATIC_CACHE[full_path] = refreshed
+    return refreshed
+
+
+def _drop_static_cache_entry(full_path: str, entry: Tuple[bytes, bytes, float, float]) -> None:
+    """
+    Удаляет файл из кэша статических файлов.
+
+    Args:
+        full_path: Нормализованный путь к файлу
+        entry: Удаляемая запись; если в кэше уже другая запись, она остаётся
+    """
+    global _static_cache_total
+    with _static_cache_lock:
+        if _STATIC_CACHE.get(full_path) is entry:
+            del _STATIC_CACHE[full_path]
+            _static_cache_total -= len(entry[1])
+
+
+def _put_static_cache_entry(full_path: str, entry: Tuple[bytes, bytes, float, float]) -> None:
+    """
+    Добавляет файл в кэш статических файлов.
+
+    Если суммарный размер кэша превысит _STATIC_CACHE_MAX_TOTAL,
+    вытесняются самые давно добавленные файлы (размер одного файла
+    не больше _STATIC_CACHE_MAX_SIZE, поэтому он всегда помещается).
+
+    Args:
+        full_path: Нормализованный путь к файлу
+        entry: Запись кэша
+    """
+    global _static_cache_total
+    with _static_cache_lock:
+        old = _STATIC_CACHE.pop(full_path, None)
+        if old is not None:
+            _static_cache_total -= len(old[1])
+        size = len(entry[1])
+        while _STATIC_CACHE and _static_cache_total + size > _STATIC_CACHE_MAX_TOTAL:
+            _static_cache_total -= len(_STATIC_CACHE.pop(next(iter(_STATIC_CACHE)))[1])
+        _STATIC_CACHE[full_path] = entry
+        _static_cache_total += size
+
+
+def _parse_query(query: str) -> Dict[str, str]:
+    """
+    Разбирает строку запроса вида "a=1&b=2".
+
+    Упрощённая замена urllib.parse.parse_qs: для каждого параметра берётся
+    первое непустое значение, а декодирование выполняется только для
+    значений, содержащих "%" или "+".
+
+    Args:
+        query: Строка запроса (без "?")
+
+    Returns:
+        Словарь с параметрами запроса
+    """
+    params: Dict[str, str] = {}
+    if not query:
+        return params
+    for part in query.split("&"):
+        key, _, value = part.partition("=")
+        if not value:
+            continue
+        if "%" in key or "+" in key:
+            key = urllib.parse.unquote_plus(key)
+        if "%" in value or "+" in value:
+            value = urllib.parse.unquote_plus(value)
+        params.setdefault(key, value)
+    return params
 
 
 class CurrencyTrackerHandler(http.server.BaseHTTPRequestHandler):
@@ -25,6 +249,13 @@ class CurrencyTrackerHandler(http.server.BaseHTTPRequestHandler):
     Реализует маршрутизацию и обработку всех запросов приложения.
     """
 
+    # HTTP/1.1 позволяет браузеру загружать страницу, стили и изображения
+    # через одно соединение; поэтому каждый ответ содержит Content-Length
+    protocol_version = "HTTP/1.1"
+    # Таймаут сокета, секунд: простаивающее постоянное соединение
+    # закрывается и не занимает поток сервера бесконечно
+    timeout = 15
+
     # Общие данные приложения (заглушки для демонстрации)
     _users: List[User] = [
         User(1, "Иван Иванов"),
@@ -34,12 +265,12 @@ class CurrencyTrackerHandler(http.server.BaseHTTPRequestHandler):
     ]
 
     _currencies: List[Currency] = [
-        Currency(1, 840, "USD", "Доллар США", 90.50, 1),
-        Currency(2, 978, "EUR", "Евро", 98.75, 1),
-        Currency(3, 826, "GBP", "Фунт стерлингов", 115.20, 1),
-        Currency(4, 392, "JPY", "Японская йена", 0.60, 100),
-        Currency(5, 756, "CHF", "Швейцарский франк", 102.30, 1),
-        Currency(6, 156, "CNY", "Китайский юань", 12.50, 1)
+        Currency.create(1, 840, "USD", "Доллар США", 90.50, 1),
+        Currency.create(2, 978, "EUR", "Евро", 98.75, 1),
+        Currency.create(3, 826, "GBP", "Фунт стерлингов", 115.20, 1),
+        Currency.create(4, 392, "JPY", "Японская йена", 0.60, 100),
+        Currency.create(5, 756, "CHF", "Швейцарский франк", 102.30, 1),
+        Currency.create(6, 156, "CNY", "Китайский юань", 12.50, 1)
     ]
 
     _user_currencies: List[UserCurrency] = [
@@ -53,11 +284,14 @@ class CurrencyTrackerHandler(http.server.BaseHTTPRequestHandler):
         UserCurrency(8, 4, 5),  # Елена → CHF
     ]
 
-    # Инициализация Jinja2 Environment (один раз при старте)
-    env = Environment(
-        loader=PackageLoader("myapp"),
-        autoescape=select_autoescape()
-    )
+    # Индексы по неизменным данным (строятся один раз при загрузке класса)
+    _users_by_id: Dict[int, User] = {u.id: u for u in _users}
+    _currencies_by_id: Dict[int, Currency] = {c.id: c for c in _currencies}
+    _subs_by_user: Counter = Counter(uc.user_id for uc in _user_currencies)
+    _currency_ids_by_user: Dict[int, List[int]] = defaultdict(list)
+    for _uc in _user_currencies:
+        _currency_ids_by_user[_uc.user_id].append(_uc.currency_id)
+    del _uc
 
     def _render_template(self, template_name: str, context: Dict) -> bytes:
         """
@@ -70,8 +304,9 @@ class CurrencyTrackerHandler(http.server.BaseHTTPRequestHandler):
         Returns:
             Отрендеренный HTML в виде bytes
         """
-        template = self.env.get_template(template_name)
-        html_content = template.render(**context)
+        # render() собирает страницу одним join, а encode() для ASCII-текста
+        # сводится к копированию памяти; поблочный stream().dump() заметно медленнее
+        html_content = _TEMPLATES[template_name].render(**context)
         return html_content.encode('utf-8')
 
     def _send_response(self, content: bytes, content_type: str = "text/html; charset=utf-8") -> None:
@@ -82,11 +317,7 @@ class CurrencyTrackerHandler(http.server.BaseHTTPRequestHandler):
             content: Содержимое ответа
             content_type: MIME-тип контента
         """
-        self.send_response(200)
-        self.send_header("Content-Type", content_type)
-        self.send_header("Content-Length", str(len(content)))
-        self.end_headers()
-        self.wfile.write(content)
+        self._write_raw(200, content_type, content)
 
     def _send_error(self, message: str, code: int = 404) -> None:
         """
@@ -96,81 +327,124 @@ class CurrencyTrackerHandler(http.server.BaseHTTPRequestHandler):
             message: Сообщение об ошибке
             code: HTTP код ошибки
         """
-        self.send_response(code)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.end_headers()
-        error_html = f"""
-        <html>
-        <head><title>Ошибка {code}</title></head>
-        <body>
-            <h1>Ошибка {code}</h1>
-            <p>{message}</p>
-            <p><a href="/">Вернуться на главную</a></p>
-        </body>
-        </html>
-        """
-        self.wfile.write(error_html.encode('utf-8'))
+        self._write_raw(code, "text/html; charset=utf-8", _error_body(code, message))
 
-    def _get_query_params(self) -> Dict[str, List[str]]:
+    def _write_raw(self, code: int, content_type: str, body: bytes) -> None:
         """
-        Извлекает параметры запроса из URL.
+        Записывает ответ целиком (строку статуса, заголовки и тело) одним вызовом.
 
-        Returns:
-            Словарь с параметрами запроса
+        Args:
+            code: HTTP код ответа
+            content_type: MIME-тип контента
+            body: Тело ответа
         """
-        query_string = urllib.parse.urlparse(self.path).query
-        return urllib.parse.parse_qs(query_string)
+        self.wfile.write(
+            self._response_head(code) + _content_headers(content_type, len(body)) + body
+        )
 
-    def _handle_static_file(self) -> None:
+    def _handle_static_file(self, path: str) -> None:
         """
         Обрабатывает запросы к статическим файлам.
+
+        Args:
+            path: Путь запроса без строки параметров
         """
         try:
             # Убираем /static/ из пути
-            file_path = self.path[8:]
+            file_path = path[8:]
 
             # Безопасность: запрещаем доступ к файлам вне папки static
             if '..' in file_path or file_path.startswith('/'):
                 self._send_error("Доступ запрещен", 403)
                 return
 
+            # Приводим путь к единому виду, чтобы варианты вроде "./a.css"
+            # и "a.css" указывали на одну запись кэша
+            file_path = os.path.normpath(file_path)
+            if file_path == '.' or os.path.isabs(file_path):
+                self._send_error("Доступ запрещен", 403)
+                return
+
             full_path = f"static/{file_path}"
 
-            # Проверяем существование файла
-            if not os.path.exists(full_path):
-                self._send_error("Файл не найден", 404)
+            # Повторные запросы к небольшим файлам отдаём из памяти
+            cached = _get_static_cache_entry(full_path)
+            if cached is not None:
+                headers, content = cached[0], cached[1]
+                self.wfile.write(self._response_head(200) + headers + content)
                 return
 
             # Определяем MIME-тип по расширению
-            if full_path.endswith('.css'):
-                mime_type = 'text/css'
-            elif full_path.endswith('.js'):
-                mime_type = 'application/javascript'
-            elif full_path.endswith('.png'):
-                mime_type = 'image/png'
-            elif full_path.endswith('.jpg') or full_path.endswith('.jpeg'):
-                mime_type = 'image/jpeg'
-            elif full_path.endswith('.gif'):
-                mime_type = 'image/gif'
-            elif full_path.endswith('.ico'):
-                mime_type = 'image/x-icon'
-            elif full_path.endswith('.svg'):
-                mime_type = 'image/svg+xml'
-            else:
-                mime_type = 'application/octet-stream'
+            ext = os.path.splitext(full_path)[1]
+            mime_type = _MIME_TYPES.get(ext, 'application/octet-stream')
 
-            with open(full_path, 'rb') as f:
-                content = f.read()
+            try:
+                f = open(full_path, 'rb')
+            except FileNotFoundError:
+                self._send_error("Файл не найден", 404)
+                return
 
-            self.send_response(200)
-            self.send_header("Content-Type", mime_type)
-            self.send_header("Content-Length", str(len(content)))
-            self.end_headers()
-            self.wfile.write(content)
+            with f:
+                st = os.fstat(f.fileno())
+                size = st.st_size
+
+                if size <= _STATIC_CACHE_MAX_SIZE:
+                    content = f.read()
+                    headers = _content_headers(mime_type, len(content))
+                    _put_static_cache_entry(
+                        full_path, (headers, content, st.st_mtime, time.monotonic())
+                    )
+                    self.wfile.write(self._response_head(200) + headers + content)
+                    return
+
+                self.wfile.write(self._response_head(200) + _content_headers(mime_type, size))
+                # Заголовки уже отправлены: если тело передано не полностью,
+                # второй ответ писать нельзя, поэтому соединение закрывается
+                try:
+                    sent = self._send_file(f, size)
+                except OSError:
+                    sent = -1
+                if sent != size:
+                    self.close_connection = True
 
         except Exception as e:
             self._send_error(f"Ошибка при чтении файла: {str(e)}", 500)
 
+    def _response_head(self, code: int) -> bytes:
+        """
+        Формирует строку статуса и общие заголовки ответа.
+
+        Args:
+            code: HTTP код ответа
+
+        Returns:
+            Строка статуса и заголовки Server и Date в виде bytes
+        """
+        self.log_request(code)
+        return (
+            f"{self.protocol_version} {code} {self.responses[code][0]}\r\n"
+            f"Server: {self.version_string()}\r\n"
+            f"Date: {_http_date()}\r\n"
+        ).encode('latin-1')
+
+    def _send_file(self, f, size: int) -> int:
+        """
+        Передаёт содержимое открытого файла в сокет клиента.
+
+        Использует socket.sendfile: данные копируются ядром напрямую из файла
+        в сокет (os.sendfile), без чтения в память процесса, а ожидание
+        готовности сокета учитывает таймаут соединения.
+
+        Args:
+            f: Файл, открытый в двоичном режиме
+            size: Размер файла в байтах
+
+        Returns:
+            Количество переданных байт (меньше size, если файл укоротился)
+        """
+        self.wfile.flush()
+        return self.connection.sendfile(f, 0, size)
+
     def do_GET(self) -> None:
         """
         Обрабатывает GET запросы.
@@ -183,12 +457,12 @@ class CurrencyTrackerHandler(http.server.BaseHTTPRequestHandler):
         - /author : информация об авторе
         - /static/... : статические файлы
         """
-        path = urllib.parse.urlparse(self.path).path
+        path, _, query = self.path.partition("?")
 
         try:
             # Обработка статических файлов
             if path.startswith('/static/'):
-                self._handle_static_file()
+                self._handle_static_file(path)
                 return
 
             # Основная маршрутизация
@@ -197,7 +471,7 @@ class CurrencyTrackerHandler(http.server.BaseHTTPRequestHandler):
             elif path == "/users":
                 self._handle_users()
             elif path == "/user":
-                self._handle_user_detail()
+                self._handle_user_detail(query)
             elif path == "/currencies":
                 self._handle_currencies()
             elif path == "/author":
@@ -234,11 +508,10 @@ class CurrencyTrackerHandler(http.server.BaseHTTPRequestHandler):
         # Добавляем информацию о количестве подписок для каждого пользователя
         users_with_subscriptions = []
         for user in self._users:
-            subscription_count = sum(1 for uc in self._user_currencies if uc.user_id == user.id)
             users_with_subscriptions.append({
                 "id": user.id,
                 "name": user.name,
-                "subscriptions_count": subscription_count
+                "subscriptions_count": self._subs_by_user[user.id]
             })
 
         context = {
@@ -249,12 +522,15 @@ class CurrencyTrackerHandler(http.server.BaseHTTPRequestHandler):
         html_content = self._render_template("users.html", context)
         self._send_response(html_content)
 
-    def _handle_user_detail(self) -> None:
+    def _handle_user_detail(self, query: str) -> None:
         """
         Обрабатывает запрос к информации о конкретном пользователе.
+
+        Args:
+            query: Строка параметров запроса (после "?")
         """
-        params = self._get_query_params()
-        user_id = params.get("id", [None])[0]
+        params = _parse_query(query)
+        user_id = params.get("id")
 
         if not user_id:
             self._send_error("Не указан ID пользователя")
@@ -262,19 +538,18 @@ class CurrencyTrackerHandler(http.server.BaseHTTPRequestHandler):
 
         try:
             user_id = int(user_id)
-            user = next((u for u in self._users if u.id == user_id), None)
+            user = self._users_by_id.get(user_id)
 
             if not user:
                 self._send_error(f"Пользователь с ID {user_id} не найден")
                 return
 
             # Находим валюты, на которые подписан пользователь
-            currency_ids = [uc.currency_id for uc in self._user_currencies if uc.user_id == user_id]
-            subscriptions = [c for c in self._currencies if c.id in currency_ids]
-
-            # Добавляем вычисляемое поле для курса за единицу
-            for currency in subscriptions:
-                currency.value_per_unit = currency.get_value_per_unit()
+            currency_ids = self._currency_ids_by_user.get(user_id, [])
+            subscriptions = [
+                self._currencies_by_id[cid]
+                for cid in currency_ids if cid in self._currencies_by_id
+            ]
 
             context = {
                 "user": user,
@@ -300,50 +575,40 @@ class CurrencyTrackerHandler(http.server.BaseHTTPRequestHandler):
         try:
             # Пытаемся получить актуальные курсы через API
             currency_codes = [c.char_code for c in self._currencies]
-            api_currencies = get_currencies(currency_codes)
-
-            # Обновляем курсы в наших объектах Currency
-            currencies_with_api_data = []
-            for currency in self._currencies:
-                if currency.char_code in api_currencies:
-                    # Сохраняем старое значение для отображения изменения
-                    old_value = currency.value
-                    # Обновляем значение
-                    currency.value = api_currencies[currency.char_code]
-                    # Вычисляем изменение
-                    change = currency.value - old_value if old_value else 0
-
-                    currencies_with_api_data.append({
-                        "id": currency.id,
-                        "num_code": currency.num_code,
-                        "char_code": currency.char_code,
-                        "name": currency.name,
-                        "value": currency.value,
-                        "nominal": currency.nominal,
-                        "value_per_unit": currency.get_value_per_unit(),
-                        "change": change
-                    })
-                else:
+            api_currencies, update_time = get_cached_currencies(currency_codes)
+
+            # Страница зависит только от курсов и времени их получения,
+            # которые меняются лишь при обновлении кэша курсов
+            page_key = (tuple(api_currencies.items()), update_time)
+            page = _CURRENCIES_PAGE_CACHE.get(page_key)
+            if page is None:
+                # Общие объекты Currency не изменяем: курсы из API попадают
+                # только в данные для шаблона, собранные для этого запроса
+                currencies_with_api_data = []
+                for currency in self._currencies:
                     # Если курс не получен из API, используем старый
+                    value = api_currencies.get(currency.char_code, currency.value)
                     currencies_with_api_data.append({
                         "id": currency.id,
                         "num_code": currency.num_code,
                         "char_code": currency.char_code,
                         "name": currency.name,
-                        "value": currency.value,
+                        "value": value,
                         "nominal": currency.nominal,
-                        "value_per_unit": currency.get_value_per_unit(),
-                        "change": 0
+                        "value_per_unit": value / currency.nominal
                     })
 
-            context = {
-                "currencies": currencies_with_api_data,
-                "update_time": datetime.now().strftime("%d.%m.%Y %H:%M:%S"),
-                "request_path": "/currencies"
-            }
+                context = {
+                    "currencies": currencies_with_api_data,
+                    "update_time": update_time,
+                    "request_path": "/currencies"
+                }
 
-            html_content = self._render_template("currencies.html", context)
-            self._send_response(html_content)
+                page = self._render_template("currencies.html", context)
+                _CURRENCIES_PAGE_CACHE.clear()
+                _CURRENCIES_PAGE_CACHE[page_key] = page
+
+            self._send_response(page)
 
         except Exception as e:
             # Если API не доступно, показываем статические данные
@@ -358,13 +623,12 @@ class CurrencyTrackerHandler(http.server.BaseHTTPRequestHandler):
                     "name": currency.name,
                     "value": currency.value,
                     "nominal": currency.nominal,
-                    "value_per_unit": currency.get_value_per_unit(),
-                    "change": 0
+                    "value_per_unit": currency.get_value_per_unit()
                 })
 
             context = {
                 "currencies": currencies_with_data,
-                "update_time": datetime.now().strftime("%d.%m.%Y %H:%M:%S") + " (статические данные)",
+                "update_time": time.strftime(UPDATE_TIME_FORMAT) + " (статические данные)",
                 "request_path": "/currencies"
             }
 
@@ -399,7 +663,9 @@ def run_server(port: int = 8000) -> None:
         port: Порт для запуска сервера
     """
     handler = CurrencyTrackerHandler
-    with socketserver.TCPServer(("", port), handler) as httpd:
+    # Каждый запрос обрабатывается в отдельном потоке, чтобы медленный
+    # запрос к API Центробанка не блокировал остальных клиентов
+    with http.server.ThreadingHTTPServer(("", port), handler) as httpd:
         print(f"Сервер запущен на http://localhost:{port}")
         print("Доступные маршруты:")
         print("  /           - Главная страница")
@@ -3,16 +3,54 @@
 Содержит функцию get_currencies для получения текущих курсов.
 """
 
+import concurrent.futures
+import functools
 import requests
 import logging
+import logging.handlers
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+try:
+    # orjson - быстрый парсер JSON на C; если он не установлен,
+    # используется стандартный разбор через requests
+    import orjson
+except ImportError:
+    orjson = None
+
+# Адрес API Центробанка с ежедневными курсами
+CBR_URL = 'https://www.cbr-xml-daily.ru/daily_json.js'
+# Время жизни закэшированных курсов, секунд (ЦБ обновляет курсы раз в день)
+CACHE_TTL = 300
+# Таймаут запроса к API, секунд
+REQUEST_TIMEOUT = 2
+# Сколько секунд повторные вызовы получают ошибку последнего запроса к API,
+# не обращаясь к нему снова
+ERROR_CACHE_TTL = 5
+# Сколько секунд поток ждёт результата запроса к API, выполняемого другим потоком
+FETCH_WAIT_TIMEOUT = 10
+# Формат времени получения курсов
+UPDATE_TIME_FORMAT = "%d.%m.%Y %H:%M:%S"
+
+# Общая сессия держит TCP-соединения с API открытыми между запросами
+_session = requests.Session()
+# Блокировка таблиц _pending_fetches и _failed_fetches (на время запроса к API не удерживается)
+_fetch_lock = threading.Lock()
+# Выполняющиеся запросы курсов: (коды, url) -> Future с их результатом
+_pending_fetches: Dict[Tuple[Tuple[str, ...], str], concurrent.futures.Future] = {}
+# Недавние ошибки запросов: (коды, url) -> (момент истечения по time.monotonic, исключение)
+_failed_fetches: Dict[Tuple[Tuple[str, ...], str], Tuple[float, Exception]] = {}
 
 
 def create_logger() -> logging.Logger:
     """
     Создаёт логгер, записывающий всё в файл.
 
+    Файл ротируется при достижении 1 МБ (хранится до трёх старых копий),
+    поэтому его размер на долго работающем сервере ограничен.
+
     Returns:
         Настроенный логгер.
     """
@@ -22,7 +60,12 @@ def create_logger() -> logging.Logger:
     if logger_obj.handlers:
         return logger_obj
 
-    handler = logging.FileHandler("app.log", encoding="utf-8")
+    handler = logging.handlers.RotatingFileHandler(
+        "app.log",
+        maxBytes=1 << 20,
+        backupCount=3,
+        encoding="utf-8"
+    )
     formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
     handler.setFormatter(formatter)
     logger_obj.addHandler(handler)
@@ -85,10 +128,9 @@ def logger(func=None, *, handle=None):
     return inner
 
 
-@logger(handle=file_log)
 def get_currencies(
     currency_codes: List[str],
-    url: str = 'https://www.cbr-xml-daily.ru/daily_json.js',
+    url: str = CBR_URL,
     handle=file_log
 ) -> Dict[str, float]:
     """
@@ -108,53 +150,137 @@ def get_currencies(
         ValueError: если получен некорректный JSON
         requests.exceptions.RequestException: при ошибках сети
     """
-    handle.info(f'Начало работы функции get_currencies. Аргументы: currency_codes = {currency_codes}')
+    handle.info('Начало работы функции get_currencies. Аргументы: currency_codes = %s', currency_codes)
     try:
-        response = requests.get(url)
+        response = _session.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content) if orjson is not None else response.json()
         currencies = {}
 
-        if "Valute" in data:
-            for code in currency_codes:
-                if code in data["Valute"]:
-                    if not isinstance(data["Valute"][code]["Value"], (int, float)):
-                        handle.error(f"Курс {code} не числовой")
-                        reading_log(handle)
-                        raise TypeError(f"Курс валюты '{code}' имеет неверный тип")
-                    else:
-                        currencies[code] = data["Valute"][code]["Value"]
-                else:
-                    handle.error(f"Валюты '{code}' нет в данных API")
-                    reading_log(handle)
-                    raise KeyError(f"Валюта '{code}' не найдена")
-
-        else:
+        valute = data.get("Valute")
+        if valute is None:
             handle.error("Ключ 'Valute' отсутствует в данных API")
-            reading_log(handle)
             raise KeyError("Нет ключа 'Valute' в данных API")
-        handle.info(f'Успешное завершение работы функции get_currencies. Результат: currencies = {currencies}')
+
+        for code in currency_codes:
+            entry = valute.get(code)
+            if entry is None:
+                handle.error("Валюты '%s' нет в данных API", code)
+                raise KeyError(f"Валюта '{code}' не найдена")
+            value = entry["Value"]
+            value_type = type(value)
+            if value_type is not float and value_type is not int:
+                handle.error("Курс %s не числовой", code)
+                raise TypeError(f"Курс валюты '{code}' имеет неверный тип")
+            currencies[code] = value
+        handle.info('Успешное завершение работы функции get_currencies. Результат: currencies = %s', currencies)
         return currencies
 
     except ValueError as e:
-        handle.error(f"Некорректный JSON: {e}")
-        reading_log(handle)
+        handle.error("Некорректный JSON: %s", e)
         raise
 
     except requests.exceptions.ConnectionError as e:
-        handle.error(f"Ошибка сети, API недоступен: {e}")
-        reading_log(handle)
+        handle.error("Ошибка сети, API недоступен: %s", e)
         raise
 
     except requests.exceptions.RequestException as e:
-        handle.error(f"Ошибка при запросе API: {e}")
-        reading_log(handle)
+        handle.error("Ошибка при запросе API: %s", e)
         raise
 
     except Exception as e:
-        handle.error(f"Упали с исключением: {e}")
-        reading_log(handle)
+        handle.error("Упали с исключением: %s", e)
+        raise
+
+
+@functools.lru_cache(maxsize=8)
+def _get_currencies_for_period(
+    currency_codes: Tuple[str, ...],
+    url: str,
+    period: int
+) -> Tuple[Dict[str, float], str]:
+    """
+    Запрашивает курсы валют и кэширует результат вместе со временем запроса.
+
+    Args:
+        currency_codes: отсортированный кортеж кодов валют
+        url: URL API Центробанка
+        period: номер интервала времени длиной CACHE_TTL; при смене
+            интервала меняется ключ кэша и курсы запрашиваются заново
+
+    Returns:
+        Кортеж из словаря курсов (код валюты -> курс к рублю) и времени
+        их получения в формате UPDATE_TIME_FORMAT.
+    """
+    currencies = get_currencies(list(currency_codes), url)
+    return currencies, time.strftime(UPDATE_TIME_FORMAT)
+
+
+def get_cached_currencies(
+    currency_codes: List[str],
+    url: str = CBR_URL,
+    ttl: int = CACHE_TTL
+) -> Tuple[Dict[str, float], str]:
+    """
+    Получает курсы валют, обращаясь к API не чаще одного раза за ttl секунд.
+
+    Одновременные вызовы не порождают параллельных запросов к API: первый
+    поток выполняет запрос, остальные дожидаются и получают его результат
+    или исключение (но ждут не дольше FETCH_WAIT_TIMEOUT секунд). Ошибка
+    запоминается на ERROR_CACHE_TTL секунд: в течение этого времени вызовы
+    сразу получают её, не обращаясь к API.
+
+    Args:
+        currency_codes: список кодов валют для получения курсов
+        url: URL API Центробанка
+        ttl: время жизни закэшированных курсов, секунд
+
+    Returns:
+        Кортеж из словаря курсов (код валюты -> курс к рублю) и времени
+        их получения в формате UPDATE_TIME_FORMAT.
+
+    Raises:
+        Те же исключения, что и get_currencies.
+        TimeoutError: если запрос другого потока не завершился
+            за FETCH_WAIT_TIMEOUT секунд
+    """
+    codes = tuple(sorted(currency_codes))
+    key = (codes, url)
+    with _fetch_lock:
+        failed = _failed_fetches.get(key)
+        if failed is not None:
+            if time.monotonic() < failed[0]:
+                raise failed[1].with_traceback(None)
+            del _failed_fetches[key]
+        future = _pending_fetches.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = concurrent.futures.Future()
+            _pending_fetches[key] = future
+
+    if not is_leader:
+        currencies, update_time = future.result(timeout=FETCH_WAIT_TIMEOUT)
+        return dict(currencies), update_time
+
+    # Ожидающие потоки получают результат или исключение при любом
+    # завершении запроса, а запись о нём всегда удаляется
+    try:
+        result = _get_currencies_for_period(codes, url, int(time.time() // ttl))
+    except BaseException as e:
+        # Прерывания (KeyboardInterrupt, SystemExit) не запоминаются
+        if isinstance(e, Exception):
+            with _fetch_lock:
+                _failed_fetches[key] = (time.monotonic() + ERROR_CACHE_TTL, e)
+        future.set_exception(e)
         raise
+    else:
+        future.set_result(result)
+    finally:
+        with _fetch_lock:
+            del _pending_fetches[key]
+
+    currencies, update_time = result
+    return dict(currencies), update_time
 
 
 @logger(handle=file_log)